@@ -1,6 +1,8 @@
 """ This module handles transformations between Lorentz frames and
 different inputs required by the low-level event generator interfaces.
 """
+import math
+
 import numpy as np
 from chromo.util import (
     TaggedFloat,
@@ -16,9 +18,43 @@ from chromo.constants import nucleon_mass, MeV, GeV, TeV, PeV, EeV
 from chromo.util import CompositeTarget, EventFrame
 from particle import PDGID
 import dataclasses
+import functools
 from typing import Union, Tuple
 
 
+# hoisted so that apply_boost does not re-bind them on every call
+_CMS = EventFrame.CENTER_OF_MASS
+_FT = EventFrame.FIXED_TARGET
+
+
+try:
+    # accelerate with numba if numba is available
+    import numba as nb
+
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def _boost_inplace(en, pz, boost_matrix):
+        # single fused pass over the event; each element is read and
+        # written exactly once, without temporary arrays
+        g = boost_matrix[0, 0]
+        bg = boost_matrix[0, 1]
+        for i in nb.prange(en.size):
+            e = en[i]
+            p = pz[i]
+            en[i] = g * e + bg * p
+            pz[i] = bg * e + g * p
+
+except ModuleNotFoundError:
+
+    def _boost_inplace(en, pz, boost_matrix):
+        # the boost is a 2x2 matrix product applied column-wise; np.dot
+        # dispatches it to BLAS (out must not alias the input)
+        v = np.stack((en, pz))
+        w = np.empty_like(v)
+        np.dot(boost_matrix, v, out=w)
+        en[:] = w[0]
+        pz[:] = w[1]
+
+
 __all__ = (
     "EventFrame",
     "CompositeTarget",
@@ -36,6 +72,36 @@ __all__ = (
 )
 
 
+# The converters below turn a single energy-like quantity into the full
+# (ecm, plab, elab, ekin) set. They are cached because energy scans often
+# construct many EventKinematics with identical arguments.
+
+
+@functools.lru_cache(maxsize=1024)
+def _from_ecm(ecm, m1, m2):
+    elab = ecm2elab(ecm, m1, m2)
+    return ecm, energy2momentum(elab, m1), elab, elab - m1
+
+
+@functools.lru_cache(maxsize=1024)
+def _from_elab(elab, m1, m2):
+    if not (elab > m1):
+        raise ValueError("projectile energy > projectile mass required")
+    return elab2ecm(elab, m1, m2), energy2momentum(elab, m1), elab, elab - m1
+
+
+@functools.lru_cache(maxsize=1024)
+def _from_ekin(ekin, m1, m2):
+    elab = ekin + m1
+    return elab2ecm(elab, m1, m2), energy2momentum(elab, m1), elab, ekin
+
+
+@functools.lru_cache(maxsize=1024)
+def _from_plab(plab, m1, m2):
+    elab = momentum2energy(plab, m1)
+    return elab2ecm(elab, m1, m2), plab, elab, elab - m1
+
+
 @dataclasses.dataclass
 class EventKinematicsBase:
     """Handles kinematic variables and conversions between reference frames.
@@ -71,6 +137,23 @@ class EventKinematicsBase:
             nuclei, it is the momentum per nucleon.
     """
 
+    # no per-instance __dict__; attribute access in apply_boost is a hot path
+    __slots__ = (
+        "frame",
+        "p1",
+        "p2",
+        "ecm",
+        "plab",
+        "elab",
+        "ekin",
+        "beams",
+        "_gamma_cm",
+        "_betagamma_cm",
+        "_boost_fwd",
+        "_boost_bwd",
+        "_boost_noop_for",
+    )
+
     frame: EventFrame
     p1: Union[PDGID, Tuple[int, int]]
     p2: Union[PDGID, Tuple[int, int], CompositeTarget]
@@ -78,41 +161,59 @@ class EventKinematicsBase:
     plab: float
     elab: float
     ekin: float
-    beams: Tuple[np.ndarray, np.ndarray]
+    beams: np.ndarray  # (2, 4) array with projectile and target four-momenta
     _gamma_cm: float
     _betagamma_cm: float
 
+    def __post_init__(self):
+        # precompute the boost matrices for both frame directions, so that
+        # apply_boost does no arithmetic and no allocation per call
+        g = self._gamma_cm
+        bg = self._betagamma_cm
+        self._boost_fwd = np.array([[g, bg], [bg, g]])
+        self._boost_bwd = np.array([[g, -bg], [-bg, g]])
+        # generators running in this frame need no boost; resolved once so
+        # that the common case in apply_boost is a single identity check
+        self._boost_noop_for = self.frame
+
     def apply_boost(self, event, generator_frame):
-        if generator_frame == self.frame:
+        if generator_frame is self._boost_noop_for:
             return
-        CMS = EventFrame.CENTER_OF_MASS
-        FT = EventFrame.FIXED_TARGET
-        if generator_frame == FT and self.frame == CMS:
-            bg = -self._betagamma_cm
-        elif generator_frame == CMS and self.frame == FT:
-            bg = self._betagamma_cm
+        if generator_frame == _FT and self.frame == _CMS:
+            boost_matrix = self._boost_bwd
+        elif generator_frame == _CMS and self.frame == _FT:
+            boost_matrix = self._boost_fwd
         else:
             raise NotImplementedError(
                 f"Boosts from {generator_frame} to {self.frame} are not yet supported"
             )
-        g = self._gamma_cm
-        en = g * event.en + bg * event.pz
-        pz = bg * event.en + g * event.pz
-        event.en[:] = en
-        event.pz[:] = pz
+        if boost_matrix.ndim != 2:
+            raise ValueError(
+                "apply_boost does not support batch kinematics, "
+                "construct a scalar EventKinematics per event instead"
+            )
+        _boost_inplace(event.en, event.pz, boost_matrix)
 
     def __eq__(self, other):
-        at = dataclasses.astuple(self)
-        bt = dataclasses.astuple(other)
-
-        def eq(a, b):
-            if isinstance(a, Tuple):
-                return all(eq(ai, bi) for (ai, bi) in zip(a, b))
+        # compare fields directly instead of via dataclasses.astuple,
+        # which deep-copies the beam arrays on every call
+        for f in dataclasses.fields(self):
+            a = getattr(self, f.name)
+            b = getattr(other, f.name)
             if isinstance(a, np.ndarray):
-                return np.array_equal(a, b)
-            return a == b
-
-        return all(eq(a, b) for (a, b) in zip(at, bt))
+                if not np.array_equal(a, b):
+                    return False
+            elif isinstance(a, tuple):
+                if len(a) != len(b) or any(
+                    not np.array_equal(ai, bi)
+                    if isinstance(ai, np.ndarray)
+                    else ai != bi
+                    for (ai, bi) in zip(a, b)
+                ):
+                    return False
+            elif a != b:
+                return False
+        return True
 
     def copy(self):
         return EventKinematicsBase(
@@ -123,13 +224,15 @@ class EventKinematicsBase:
             self.plab,
             self.elab,
             self.ekin,
-            (self.beams[0].copy(), self.beams[1].copy()),
+            self.beams.copy(),
             self._gamma_cm,
             self._betagamma_cm,
         )
 
 
 class EventKinematics(EventKinematicsBase):
+    __slots__ = ()
+
     def __init__(
         self,
         particle1,
@@ -163,54 +266,38 @@ class EventKinematics(EventKinematicsBase):
         m1 = nucleon_mass if is_real_nucleus(part1) else mass(part1)
         m2 = nucleon_mass if is_real_nucleus(part2) else mass(part2)
 
-        beams = (np.zeros(4), np.zeros(4))
+        beams = np.zeros((2, 4))
 
         # Input specification in center-of-mass frame
         if ecm is not None:
             frame = frame or EventFrame.CENTER_OF_MASS
-            ecm = ecm
-            elab = ecm2elab(ecm, m1, m2)
-            ekin = elab - m1
-            plab = energy2momentum(elab, m1)
+            ecm, plab, elab, ekin = _from_ecm(ecm, m1, m2)
         # Input specification as 4-vectors
         elif beam is not None:
             if p2_is_composite:
                 raise ValueError("beam cannot be used with CompositeTarget")
             frame = frame or EventFrame.GENERIC
             p1, p2 = beam
-            beams[0][2] = p1
-            beams[1][2] = p2
-            beams[0][3] = momentum2energy(p1, m1)
-            beams[1][3] = momentum2energy(p2, m2)
+            beams[0, 2] = p1
+            beams[1, 2] = p2
+            beams[0, 3] = momentum2energy(p1, m1)
+            beams[1, 3] = momentum2energy(p2, m2)
             s = np.sum(beams, axis=0)
             # We compute ecm with energy2momentum. It is not really energy to momentum,
             # but energy2momentum(x, y) computes x^2 - y^2, which is what we need. Here,
             # I use that px and py are always zero, if we ever change this, many formulas
             # have to change in this class, like all the boosts
-            ecm = energy2momentum(s[3], s[2])
-            elab = ecm2elab(ecm, m1, m2)
-            ekin = elab - m1
-            plab = energy2momentum(elab, m1)
+            ecm, plab, elab, ekin = _from_ecm(energy2momentum(s[3], s[2]), m1, m2)
         # Input specification in lab frame
         elif elab is not None:
-            if not (elab > m1):
-                raise ValueError("projectile energy > projectile mass required")
             frame = frame or EventFrame.FIXED_TARGET
-            elab = elab
-            ekin = elab - m1
-            plab = energy2momentum(elab, m1)
-            ecm = elab2ecm(elab, m1, m2)
+            ecm, plab, elab, ekin = _from_elab(elab, m1, m2)
         elif ekin is not None:
             frame = frame or EventFrame.FIXED_TARGET
-            elab = ekin + m1
-            plab = energy2momentum(elab, m1)
-            ecm = elab2ecm(elab, m1, m2)
+            ecm, plab, elab, ekin = _from_ekin(ekin, m1, m2)
         elif plab is not None:
             frame = frame or EventFrame.FIXED_TARGET
-            plab = plab
-            elab = momentum2energy(plab, m1)
-            ekin = elab - m1
-            ecm = elab2ecm(elab, m1, m2)
+            ecm, plab, elab, ekin = _from_plab(plab, m1, m2)
         else:
             assert False  # this should never happen
 
@@ -218,15 +305,16 @@ class EventKinematics(EventKinematicsBase):
         if frame != EventFrame.GENERIC:
             if frame == EventFrame.CENTER_OF_MASS:
                 s = ecm**2
-                pcm = np.sqrt((s - (m1 + m2) ** 2) * (s - (m1 - m2) ** 2)) / (2 * ecm)
-                beams[0][2] = pcm
-                beams[1][2] = -pcm
+                # math.sqrt avoids the ufunc dispatch overhead on scalars
+                pcm = math.sqrt((s - (m1 + m2) ** 2) * (s - (m1 - m2) ** 2)) / (2 * ecm)
+                beams[0, 2] = pcm
+                beams[1, 2] = -pcm
             elif frame == EventFrame.FIXED_TARGET:
-                beams[0][2] = plab
-                beams[1][2] = 0
+                beams[0, 2] = plab
+                beams[1, 2] = 0
             # set energies
-            for b, m in zip(beams, (m1, m2)):
-                b[3] = np.sqrt(m**2 + b[2] ** 2)
+            beams[0, 3] = math.sqrt(m1**2 + beams[0, 2] ** 2)
+            beams[1, 3] = math.sqrt(m2**2 + beams[1, 2] ** 2)
 
         _gamma_cm = (elab + m2) / ecm
         _betagamma_cm = plab / ecm
@@ -235,8 +323,90 @@ class EventKinematics(EventKinematicsBase):
             frame, part1, part2, ecm, plab, elab, ekin, beams, _gamma_cm, _betagamma_cm
         )
 
+    @classmethod
+    def batch(cls, particle1, particle2, *, ecm=None, plab=None, elab=None, ekin=None):
+        """Compute kinematics for an array of energies in one vectorized call.
+
+        This is much faster than constructing EventKinematics in a loop
+        when scanning many energies. It accepts the same energy
+        specifications as the constructor, except ``beam``, with the value
+        given as an array. The returned EventKinematicsBase holds arrays
+        in all energy-like fields, and ``beams`` has shape (N, 2, 4). It
+        is a plain container for the computed values; calling apply_boost
+        on it raises ValueError.
+        """
+
+        if sum(x is not None for x in [ecm, plab, elab, ekin]) != 1:
+            raise ValueError("Please provide only one of ecm/plab/elab/ekin arguments")
+
+        if particle1 is None or particle2 is None:
+            raise ValueError("particle1 and particle2 must be set")
+
+        part1 = process_particle(particle1)
+        part2 = process_particle(particle2)
+
+        if isinstance(part1, CompositeTarget):
+            raise ValueError("Only 2nd particle can be CompositeTarget")
+
+        m1 = nucleon_mass if is_real_nucleus(part1) else mass(part1)
+        m2 = nucleon_mass if is_real_nucleus(part2) else mass(part2)
+
+        if ecm is not None:
+            frame = EventFrame.CENTER_OF_MASS
+            ecm = np.atleast_1d(np.asarray(ecm, dtype=float))
+            elab = ecm2elab(ecm, m1, m2)
+            ekin = elab - m1
+            plab = energy2momentum(elab, m1)
+        elif elab is not None:
+            frame = EventFrame.FIXED_TARGET
+            elab = np.atleast_1d(np.asarray(elab, dtype=float))
+            if not np.all(elab > m1):
+                raise ValueError("projectile energy > projectile mass required")
+            ekin = elab - m1
+            plab = energy2momentum(elab, m1)
+            ecm = elab2ecm(elab, m1, m2)
+        elif ekin is not None:
+            frame = EventFrame.FIXED_TARGET
+            ekin = np.atleast_1d(np.asarray(ekin, dtype=float))
+            elab = ekin + m1
+            plab = energy2momentum(elab, m1)
+            ecm = elab2ecm(elab, m1, m2)
+        else:
+            frame = EventFrame.FIXED_TARGET
+            plab = np.atleast_1d(np.asarray(plab, dtype=float))
+            # np.hypot is the vectorized stable version of momentum2energy
+            elab = np.hypot(plab, m1)
+            ekin = elab - m1
+            ecm = elab2ecm(elab, m1, m2)
+
+        beams = np.zeros((len(ecm), 2, 4))
+        if frame == EventFrame.CENTER_OF_MASS:
+            s = ecm**2
+            pcm = np.sqrt((s - (m1 + m2) ** 2) * (s - (m1 - m2) ** 2)) / (2 * ecm)
+            beams[:, 0, 2] = pcm
+            beams[:, 1, 2] = -pcm
+        else:
+            beams[:, 0, 2] = plab
+        masses = np.array([m1, m2])
+        beams[:, :, 3] = np.sqrt(masses**2 + beams[:, :, 2] ** 2)
+
+        return EventKinematicsBase(
+            frame,
+            part1,
+            part2,
+            ecm,
+            plab,
+            elab,
+            ekin,
+            beams,
+            (elab + m2) / ecm,
+            plab / ecm,
+        )
+
 
 class CenterOfMass(EventKinematics):
+    __slots__ = ()
+
     def __init__(self, ecm, particle1, particle2):
         super().__init__(ecm=ecm, particle1=particle1, particle2=particle2)
 
@@ -254,6 +424,8 @@ class Momentum(TaggedFloat):
 
 
 class FixedTarget(EventKinematics):
+    __slots__ = ()
+
     def __init__(self, energy, particle1, particle2):
         if isinstance(energy, (TotalEnergy, int, float)):
             super().__init__(
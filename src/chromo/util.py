@@ -85,6 +85,25 @@ class CompositeTarget:
     def __hash__(self):
         return self.__int__().__hash__()
 
+    # the generated dataclass __eq__ cannot handle the fractions array
+    def __eq__(self, other):
+        if not isinstance(other, CompositeTarget):
+            return NotImplemented
+        return (
+            self.label == other.label
+            and self.components == other.components
+            and np.array_equal(self.fractions, other.fractions)
+        )
+
+    def copy(self):
+        """Return an independent copy of this target."""
+        obj = self.__class__.__new__(self.__class__)
+        obj.label = self.label
+        obj.components = self.components
+        obj.fractions = self.fractions.copy()
+        obj.fractions.flags["WRITEABLE"] = False
+        return obj
+
     def average_mass(self):
         return sum(
             f * p.A * nucleon_mass for (f, p) in zip(self.fractions, self.components)
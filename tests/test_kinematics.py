@@ -1,5 +1,6 @@
 from chromo.kinematics import (
     CenterOfMass,
+    EventKinematics,
     FixedTarget,
     TotalEnergy,
     KinEnergy,
@@ -84,7 +85,43 @@ def test_fixed_target_bad_input():
         FixedTarget(100 * GeV, t, "p")
 
 
+def test_batch():
+    ecm = np.linspace(5, 100, 10)
+    batch = EventKinematics.batch("p", "p", ecm=ecm)
+    assert batch.frame == EventFrame.CENTER_OF_MASS
+    for i, x in enumerate(ecm):
+        k = CenterOfMass(x, "p", "p")
+        assert batch.elab[i] == approx(k.elab)
+        assert batch.plab[i] == approx(k.plab)
+        assert batch.beams[i] == approx(k.beams)
+
+    elab = np.linspace(2, 50, 10)
+    batch = EventKinematics.batch("p", "He", elab=elab)
+    assert batch.frame == EventFrame.FIXED_TARGET
+    for i, x in enumerate(elab):
+        k = FixedTarget(x, "p", "He")
+        assert batch.ecm[i] == approx(k.ecm)
+        assert batch.beams[i] == approx(k.beams)
+
+    with pytest.raises(ValueError):
+        EventKinematics.batch("p", "p", ecm=ecm, elab=elab)
+
+    # scalar input is promoted to a length-1 batch
+    batch = EventKinematics.batch("p", "p", ecm=10.0)
+    assert batch.beams.shape == (1, 2, 4)
+
+    # batch kinematics are containers and cannot boost events
+    with pytest.raises(ValueError):
+        batch.apply_boost(None, EventFrame.FIXED_TARGET)
+
+
 def test_copy():
     a = CenterOfMass(10, "p", "p")
     b = a.copy()
     assert a == b
+
+    t = CompositeTarget([("N", 3), ("O", 1)])
+    a = CenterOfMass(10, "p", t)
+    b = a.copy()
+    assert a.p2 is not b.p2
+    assert a == b